@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Point d'entrée du plugin GISENGINE pour QGIS."""
+
+
+def classFactory(iface):
+    from .gis_engine import GisEngine
+    return GisEngine(iface)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Classe principale du plugin : intégration dans l'interface QGIS."""
+
+import os
+
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QAction
+
+
+class GisEngine:
+    """Enregistre le plugin dans QGIS et ouvre le workbench."""
+
+    def __init__(self, iface):
+        self.iface = iface
+        self.plugin_dir = os.path.dirname(__file__)
+        self.menu = "&GISENGINE"
+        self.actions = []
+        self.interface = None
+
+    def initGui(self):
+        icon_path = os.path.join(self.plugin_dir, "icon.png")
+        action = QAction(QIcon(icon_path), "GISENGINE Workbench",
+                         self.iface.mainWindow())
+        action.triggered.connect(self.run)
+        self.iface.addToolBarIcon(action)
+        self.iface.addPluginToMenu(self.menu, action)
+        self.actions.append(action)
+
+    def unload(self):
+        for action in self.actions:
+            self.iface.removePluginMenu(self.menu, action)
+            self.iface.removeToolBarIcon(action)
+        self.actions = []
+
+    def run(self):
+        from .unified_interface import UnifiedGISENGINEInterface
+        if self.interface is None:
+            self.interface = UnifiedGISENGINEInterface(self.iface.mainWindow())
+        self.interface.show()
+        self.interface.raise_()
+        self.interface.activateWindow()
@@ -0,0 +1,973 @@
+# -*- coding: utf-8 -*-
+"""Interface principale GISENGINE.
+
+Fenêtre unifiée regroupant le catalogue de transformers, le canevas de
+workflow interactif et le scanner de traitements QGIS.
+"""
+
+import logging
+import re
+import time
+from collections import namedtuple
+
+from PyQt5.QtCore import (
+    QObject,
+    QStringListModel,
+    Qt,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtGui import (
+    QBrush,
+    QColor,
+    QCursor,
+    QFont,
+    QIcon,
+    QPainter,
+    QPen,
+    QPixmap,
+)
+from PyQt5.QtWidgets import (
+    QButtonGroup,
+    QCompleter,
+    QGraphicsItem,
+    QGraphicsLineItem,
+    QGraphicsRectItem,
+    QGraphicsScene,
+    QGraphicsTextItem,
+    QGraphicsView,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QListView,
+    QListWidget,
+    QListWidgetItem,
+    QMainWindow,
+    QMessageBox,
+    QPushButton,
+    QSplitter,
+    QTabWidget,
+    QTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
+
+logger = logging.getLogger(__name__)
+
+# Enregistrement immuable d'un composant du panneau de recherche :
+# l'accès par attribut est un offset C, pas un hachage de clé, et les
+# champs dérivés (affichage, icône, index de recherche) sont figés dedans.
+Component = namedtuple(
+    "Component", "type name category description display icon hay")
+
+# Modèles partagés des boutons d'ajout rapide : construits une fois à
+# l'import, émis tels quels — aucun dict reconstruit par clic et aucun
+# consommateur ne peut muter les données d'un autre. Le champ display
+# sert d'étiquette de bouton ; l'icône est portée par l'étiquette.
+QUICK_ITEMS = (
+    Component("reader", "File Reader", "Input",
+              "Lit un fichier vectoriel", "📁 Input", None,
+              "file reader\tinput\tlit un fichier vectoriel"),
+    Component("transformer", "AttributeManager", "Attributs",
+              "Gère les champs attributaires", "🔄 Transformer", None,
+              "attributemanager\tattributs\tgère les champs attributaires"),
+    Component("writer", "File Writer", "Output",
+              "Écrit un fichier vectoriel", "💾 Output", None,
+              "file writer\toutput\técrit un fichier vectoriel"),
+)
+_QUICK_ITEMS_BY_ID = {id(item): item for item in QUICK_ITEMS}
+
+# Catalogue des transformers disponibles : (nom, catégorie, icône, description)
+_TRANSFORMERS_CATALOG = (
+    ("Buffer", "Vecteur", "⭕", "Crée une zone tampon autour des entités"),
+    ("Clipper", "Vecteur", "✂️", "Découpe les entités selon une emprise"),
+    ("Dissolver", "Vecteur", "🫧", "Fusionne les entités selon un attribut"),
+    ("Intersector", "Vecteur", "➕", "Intersection géométrique de deux couches"),
+    ("UnionMerger", "Vecteur", "🔗", "Union de deux couches vectorielles"),
+    ("Reprojector", "Vecteur", "🌍", "Reprojette une couche vers un autre SCR"),
+    ("Simplifier", "Vecteur", "📐", "Simplifie les géométries (Douglas-Peucker)"),
+    ("CentroidExtractor", "Vecteur", "🎯", "Extrait le centroïde de chaque entité"),
+    ("VoronoiCreator", "Vecteur", "🕸️", "Génère les polygones de Voronoï"),
+    ("SpatialJoiner", "Vecteur", "🧩", "Jointure spatiale entre deux couches"),
+    ("RasterCalculator", "Raster", "🧮", "Calculatrice raster (algèbre de cartes)"),
+    ("SlopeCalculator", "Raster", "⛰️", "Calcule la pente depuis un MNT"),
+    ("HillshadeCreator", "Raster", "🌄", "Génère un ombrage depuis un MNT"),
+    ("RasterClipper", "Raster", "🗜️", "Découpe un raster selon une emprise"),
+    ("Rasterizer", "Raster", "🏁", "Convertit un vecteur en raster"),
+    ("AttributeManager", "Attributs", "🏷️", "Ajoute, renomme ou supprime des champs"),
+    ("AttributeFilter", "Attributs", "🔎", "Filtre les entités selon une expression"),
+    ("CsvReader", "Base de données", "📄", "Lit un fichier CSV avec géométrie"),
+    ("PostgisReader", "Base de données", "🐘", "Lit une table PostGIS"),
+    ("GeopackageWriter", "Base de données", "📦", "Écrit les entités dans un GeoPackage"),
+)
+
+# Texte d'accueil de l'onglet Traitements. Le nombre d'algorithmes est
+# figé dans la source : inutile de le formater à chaque ouverture d'onglet.
+_PROCESSING_RESULTS_TEXT = (
+    "🔍 Scanner Processing QGIS\n"
+    "\n"
+    "Le scanner interroge le registre des algorithmes de QGIS et\n"
+    "expose chaque traitement comme un transformer GISENGINE.\n"
+    "\n"
+    "✅ 25 algorithmes trouvés\n"
+    "\n"
+    "Fournisseurs détectés :\n"
+    "  • qgis   — traitements natifs\n"
+    "  • gdal   — utilitaires raster/vecteur\n"
+    "  • grass  — modules GRASS GIS\n"
+    "\n"
+    "Glissez un transformer du catalogue vers le canevas pour\n"
+    "l'ajouter à votre workflow."
+)
+
+# Catalogue regroupé par catégorie : filtrage par catégorie en O(1) et
+# rendu par sections dans la liste.
+_TRANSFORMERS_BY_CATEGORY = {}
+for _entry in _TRANSFORMERS_CATALOG:
+    _TRANSFORMERS_BY_CATEGORY.setdefault(_entry[1], []).append(_entry)
+_TRANSFORMERS_BY_CATEGORY = {
+    category: tuple(items)
+    for category, items in _TRANSFORMERS_BY_CATEGORY.items()
+}
+
+# Préfixes reconnus dans la recherche (« raster:pente » limite à la catégorie).
+_CATEGORY_PREFIXES = {
+    category.lower(): category for category in _TRANSFORMERS_BY_CATEGORY
+}
+
+# Contenu de la boîte « À propos », assemblé une fois à l'import.
+_ABOUT_HTML = (
+    "<h2>GISENGINE</h2>"
+    "<p>Workbench de transformation de données spatiales pour QGIS, "
+    "inspiré de FME Workbench.</p>"
+    "<p>Construisez des workflows en glissant des transformers sur le "
+    "canevas, puis exécutez-les via les traitements QGIS.</p>"
+    "<p><a href='https://github.com/yadda07/gisengine'>"
+    "github.com/yadda07/gisengine</a></p>"
+)
+
+# Styles des widgets d'erreur, compilés par Qt une seule fois par chaîne :
+# les widgets d'erreur peuvent être recréés à chaque rechargement raté.
+_ERROR_HEADER_QSS = "font-size: 16px; font-weight: bold; color: #dc3545;"
+_ERROR_LABEL_QSS = "color: #6c757d; padding: 8px;"
+_ERROR_BTN_QSS = """
+    QPushButton {
+        background: #007bff;
+        color: white;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QPushButton:hover { background: #0069d9; }
+"""
+
+
+def _connect_unique(signal, slot):
+    """Connecte un signal en évitant les connexions dupliquées.
+
+    Les chemins de rechargement peuvent recâbler les mêmes signaux ;
+    Qt.UniqueConnection lève TypeError plutôt que d'empiler silencieusement
+    une deuxième connexion (et donc un double déclenchement par émission).
+    """
+    try:
+        signal.connect(slot, Qt.UniqueConnection)
+    except TypeError:
+        pass
+
+
+class DraggableTransformerItem(QListWidgetItem):
+    """Entrée du catalogue de transformers, glissable vers le canevas."""
+
+    # Sentinelle de classe : plus rapide qu'un hasattr() dans les boucles.
+    _is_transformer = True
+
+    def __init__(self, name, category, icon, description):
+        super().__init__("{}  {}".format(icon, name))
+        self.transformer_name = name
+        self.transformer_category = category
+        self.transformer_description = description
+        self.setToolTip(
+            "<b>{}</b><br><i>{}</i><br>{}".format(name, category, description)
+        )
+        self.setData(Qt.UserRole, name)
+        # Index de recherche minuscule, construit une fois pour toutes.
+        self._search_blob = "{} {} {}".format(name, category, description).lower()
+
+
+class WorkflowNode(QGraphicsRectItem):
+    """Nœud simple affiché sur le canevas de workflow interactif."""
+
+    _is_workflow_node = True
+
+    COLORS = {
+        "input": "#28a745",
+        "output": "#dc3545",
+        "transformer": "#007bff",
+    }
+
+    def __init__(self, name, node_type="transformer", x=0, y=0):
+        super().__init__(0, 0, 140, 60)
+        self.node_name = name
+        self.node_type = node_type
+        self.setPos(x, y)
+        self.setFlag(QGraphicsItem.ItemIsMovable, True)
+        self.setFlag(QGraphicsItem.ItemIsSelectable, True)
+        # Rendu mis en cache : le déplacement d'un nœud re-blitte un pixmap
+        # au lieu de re-rastériser le rectangle et son étiquette.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.setBrush(QBrush(QColor(self.COLORS.get(node_type, "#007bff"))))
+        self.setPen(QPen(QColor("#343a40"), 2))
+        label = QGraphicsTextItem(name, self)
+        label.setDefaultTextColor(QColor("white"))
+        label.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        label.setPos(8, 18)
+
+    def delete(self):
+        scene = self.scene()
+        if scene is not None:
+            if isinstance(scene, ModernWorkflowScene):
+                scene.nodes.pop(id(self), None)
+            scene.removeItem(self)
+
+
+class Connection(QGraphicsLineItem):
+    """Lien simple entre deux nœuds du canevas interactif."""
+
+    def __init__(self, start_node, end_node):
+        super().__init__()
+        self.start_node = start_node
+        self.end_node = end_node
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.setPen(QPen(QColor("#6c757d"), 2, Qt.DashLine))
+        self.update_position()
+
+    def update_position(self):
+        start = self.start_node.sceneBoundingRect().center()
+        end = self.end_node.sceneBoundingRect().center()
+        self.setLine(start.x(), start.y(), end.x(), end.y())
+
+    def delete(self):
+        scene = self.scene()
+        if scene is not None:
+            if isinstance(scene, ModernWorkflowScene):
+                scene.connection_count -= 1
+            scene.removeItem(self)
+
+
+class ModernWorkflowScene(QGraphicsScene):
+    """Scène du canevas interactif : tient la liste des nœuds créés."""
+
+    node_added = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSceneRect(0, 0, 2000, 1200)
+        # Index BSP : recherche d'items et repeints partiels en O(log N).
+        self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.setBackgroundBrush(QBrush(QColor("#f8f9fa")))
+        # Dict indexé par id(node) : insertion, test et suppression en O(1),
+        # là où la liste imposait un parcours linéaire à chaque retrait.
+        self.nodes = {}
+        # Compteur entretenu aux points d'ajout/retrait : l'affichage des
+        # totaux ne parcourt plus jamais items().
+        self.connection_count = 0
+        self.transformer_data = ()
+
+    def set_transformer_data(self, data):
+        # Le catalogue est un tuple module-level immuable : on garde la
+        # référence telle quelle, et on ne refait rien si elle n'a pas changé.
+        if data is self.transformer_data:
+            return
+        self.transformer_data = data
+
+    def add_node(self, name, node_type="transformer", x=0, y=0):
+        node = WorkflowNode(name, node_type, x, y)
+        self.addItem(node)
+        self.nodes[id(node)] = node
+        self.node_added.emit(node)
+        return node
+
+    def add_connection(self, start_node, end_node):
+        connection = Connection(start_node, end_node)
+        self.addItem(connection)
+        self.connection_count += 1
+        return connection
+
+
+class WorkflowRunner(QObject):
+    """Exécute le workflow hors du thread GUI et publie l'avancement."""
+
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(bool)
+
+    def __init__(self, scene_data):
+        super().__init__()
+        # Instantané pris sur le thread GUI : le worker ne touche ni la
+        # scène ni les widgets, et ne publie que via ses signaux.
+        self._scene_data = scene_data
+
+    def run(self):
+        from .workflow_designer import workflow_status
+        self.progress.emit("Exécution du workflow...")
+        success, message = workflow_status(self._scene_data)
+        self.progress.emit(message)
+        self.finished.emit(success)
+
+
+class ProfessionalSearchPanel(QWidget):
+    """Panneau de recherche des composants (readers, writers, transformers)."""
+
+    node_requested = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.components_data = ()
+        self.filtered_data = []
+        self.current_filter = "all"
+        self.setup_data()
+        self.setup_ui()
+        self.update_results_list()
+
+    def setup_data(self):
+        raw = [
+            {"type": "reader", "name": "File Reader", "category": "Input",
+             "description": "Lit un fichier vectoriel (SHP, GeoJSON, GPKG)"},
+            {"type": "reader", "name": "CSV Reader", "category": "Input",
+             "description": "Lit un fichier CSV avec coordonnées"},
+            {"type": "reader", "name": "PostGIS Reader", "category": "Input",
+             "description": "Lit une table PostGIS"},
+            {"type": "reader", "name": "WFS Reader", "category": "Input",
+             "description": "Interroge un flux WFS distant"},
+            {"type": "transformer", "name": "AttributeManager", "category": "Attributs",
+             "description": "Gère les champs attributaires"},
+            {"type": "transformer", "name": "Buffer", "category": "Géométrie",
+             "description": "Zone tampon autour des entités"},
+            {"type": "transformer", "name": "Clipper", "category": "Géométrie",
+             "description": "Découpage selon une emprise"},
+            {"type": "transformer", "name": "Reprojector", "category": "Géométrie",
+             "description": "Changement de système de coordonnées"},
+            {"type": "transformer", "name": "Dissolver", "category": "Géométrie",
+             "description": "Fusion d'entités par attribut"},
+            {"type": "transformer", "name": "SpatialJoiner", "category": "Géométrie",
+             "description": "Jointure spatiale"},
+            {"type": "writer", "name": "File Writer", "category": "Output",
+             "description": "Écrit un fichier vectoriel"},
+            {"type": "writer", "name": "GeoPackage Writer", "category": "Output",
+             "description": "Écrit dans un GeoPackage"},
+            {"type": "writer", "name": "PostGIS Writer", "category": "Output",
+             "description": "Écrit dans une table PostGIS"},
+        ]
+        # Icônes pré-rasterisées une fois par type : la liste blitte un
+        # pixmap en cache au lieu de re-façonner un glyphe emoji dans la
+        # police de l'item à chaque repaint.
+        self._icons = {
+            "reader": QIcon(self._make_emoji_pixmap("📁")),
+            "writer": QIcon(self._make_emoji_pixmap("💾")),
+            "transformer": QIcon(self._make_emoji_pixmap("🔄")),
+        }
+        self._default_icon = QIcon(self._make_emoji_pixmap("🔧"))
+        # Catalogue figé en enregistrements immuables : texte d'affichage,
+        # icône et index de recherche minuscule sont calculés une seule
+        # fois et rangés dans le tuple, plus rien à reformater au filtrage.
+        self.components_data = tuple(
+            Component(
+                d["type"], d["name"], d["category"], d["description"],
+                "{}\n{} - {}".format(d["name"], d["category"],
+                                     d["description"]),
+                self._icons.get(d["type"], self._default_icon),
+                "{}\t{}\t{}".format(d["name"], d["category"],
+                                    d["description"]).lower(),
+            )
+            for d in raw
+        )
+        self.filtered_data = list(self.components_data)
+
+    @staticmethod
+    def _make_emoji_pixmap(glyph, size=16):
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, glyph)
+        painter.end()
+        return pixmap
+
+    def setup_ui(self):
+        # Règles ancrées sur l'objectName : le moteur de styles ne résout
+        # plus ces sélecteurs pour chaque descendant du panneau.
+        self.setObjectName("searchPanel")
+        self.setStyleSheet("""
+            QWidget#searchPanel {
+                background: white;
+                border: 1px solid #dee2e6;
+                font-family: 'Segoe UI';
+            }
+            QWidget#searchPanel QLineEdit {
+                padding: 6px;
+                border: 1px solid #ced4da;
+                border-radius: 4px;
+                background: white;
+            }
+            QWidget#searchPanel QPushButton {
+                padding: 4px 10px;
+                border: 1px solid #ced4da;
+                border-radius: 4px;
+                background: #f8f9fa;
+            }
+            QWidget#searchPanel QPushButton:hover { background: #e9ecef; }
+            QWidget#searchPanel QListWidget {
+                border: 1px solid #dee2e6;
+                background: white;
+            }
+        """)
+        layout = QVBoxLayout(self)
+
+        title = QLabel("🔍 Recherche de composants")
+        title.setStyleSheet("font-weight: bold; border: none;")
+        layout.addWidget(title)
+
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Rechercher un composant...")
+        # Débounce : une rafale de frappes ne déclenche qu'un seul filtrage,
+        # une fois la saisie stabilisée.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self.apply_filter)
+        self.search_box.textChanged.connect(self.schedule_filter)
+        # L'autocomplétion est servie par le modèle C++ de Qt : la popup se
+        # met à jour de façon incrémentale sans repasser par Python.
+        self._completer_model = QStringListModel(
+            [comp.name for comp in self.components_data], self)
+        completer = QCompleter(self._completer_model, self.search_box)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        self.search_box.setCompleter(completer)
+        layout.addWidget(self.search_box)
+
+        filters_layout = QHBoxLayout()
+        # Un groupe exclusif et un seul slot paramétré par propriété,
+        # au lieu de quatre lambdas et d'un if/elif par type.
+        self._filter_group = QButtonGroup(self)
+        self._filter_group.setExclusive(True)
+        for label, filter_type in (("Tous", "all"), ("Readers", "reader"),
+                                   ("Transformers", "transformer"),
+                                   ("Writers", "writer")):
+            btn = QPushButton(label)
+            btn.setCheckable(True)
+            btn.setProperty("filter_type", filter_type)
+            if filter_type == "all":
+                btn.setChecked(True)
+            self._filter_group.addButton(btn)
+            filters_layout.addWidget(btn)
+        self._filter_group.buttonClicked.connect(self._on_filter_button)
+        layout.addLayout(filters_layout)
+
+        self.results_list = QListWidget()
+        # Toutes les lignes ont la même hauteur : autant le dire à Qt pour
+        # qu'il ne remesure pas chaque item, et le laisser dérouler la mise
+        # en page par lots plutôt qu'en bloc à l'ajout.
+        self.results_list.setUniformItemSizes(True)
+        self.results_list.setLayoutMode(QListView.Batched)
+        self.results_list.setBatchSize(32)
+        self.results_list.setResizeMode(QListView.Adjust)
+        self.results_list.setWordWrap(False)
+        self.results_list.setStyleSheet("""
+            QListWidget::item {
+                padding: 6px;
+                border-bottom: 1px solid #f1f3f5;
+            }
+            QListWidget::item:selected {
+                background: #e7f1ff;
+                color: #212529;
+            }
+        """)
+        self.results_list.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self._populate_results_list()
+        layout.addWidget(self.results_list)
+
+        quick_layout = QHBoxLayout()
+        for item in QUICK_ITEMS:
+            btn = QPushButton(item.display)
+            # Seul l'identifiant du modèle partagé voyage en propriété du
+            # bouton : un slot commun retrouve l'enregistrement et l'émet.
+            btn.setProperty("comp_id", id(item))
+            btn.clicked.connect(self._on_quick_clicked)
+            quick_layout.addWidget(btn)
+        quick_add_btn = QPushButton("➕")
+        quick_add_btn.setToolTip("Ajout rapide par nom")
+        quick_add_btn.clicked.connect(self.show_quick_add_dialog)
+        quick_layout.addWidget(quick_add_btn)
+        layout.addLayout(quick_layout)
+
+        self._quick_add_popup = QLineEdit(self)
+        self._quick_add_popup.setWindowFlags(Qt.Popup)
+        self._quick_add_popup.setPlaceholderText("Nom du transformer")
+        self._quick_add_popup.returnPressed.connect(self._finish_quick_add)
+
+    @pyqtSlot()
+    def _on_quick_clicked(self):
+        item = _QUICK_ITEMS_BY_ID.get(self.sender().property("comp_id"))
+        if item is not None:
+            self.node_requested.emit(item)
+
+    def schedule_filter(self, _text=""):
+        self._filter_timer.start()
+
+    def apply_filter(self):
+        self.filter_components(self.search_box.text())
+
+    def filter_components(self, text):
+        text = text.lower()
+        current_filter = self.current_filter
+        self.filtered_data = [
+            comp for comp in self.components_data
+            if (current_filter == "all" or comp.type == current_filter)
+            and text in comp.hay
+        ]
+        self.update_results_list()
+
+    def _on_filter_button(self, button):
+        self.set_filter(button.property("filter_type"))
+
+    def set_filter(self, filter_type):
+        if filter_type == self.current_filter:
+            return
+        self.current_filter = filter_type
+        self.filter_components(self.search_box.text())
+
+    def _populate_results_list(self):
+        # Les items sont créés une seule fois ; le filtrage ne fait ensuite
+        # que basculer leur visibilité au lieu de tout détruire/recréer.
+        self._result_items = []
+        for comp in self.components_data:
+            item = QListWidgetItem(comp.icon, comp.display)
+            item.setData(Qt.UserRole, comp)
+            self.results_list.addItem(item)
+            self._result_items.append(item)
+
+    def update_results_list(self):
+        visible_ids = set(map(id, self.filtered_data))
+        for comp, item in zip(self.components_data, self._result_items):
+            hidden = id(comp) not in visible_ids
+            if item.isHidden() != hidden:
+                item.setHidden(hidden)
+
+    def on_item_double_clicked(self, item):
+        comp = item.data(Qt.UserRole)
+        if comp:
+            self.node_requested.emit(comp)
+
+    def show_quick_add_dialog(self):
+        # Popup non modale : la saisie du nom ne bloque plus la boucle
+        # d'événements, le reste de l'interface reste interactive.
+        self._quick_add_popup.clear()
+        self._quick_add_popup.move(QCursor.pos())
+        self._quick_add_popup.show()
+        self._quick_add_popup.setFocus()
+
+    def _finish_quick_add(self):
+        name = self._quick_add_popup.text().strip()
+        self._quick_add_popup.hide()
+        if name:
+            self.node_requested.emit({
+                "type": "transformer",
+                "name": name,
+                "category": "Personnalisé",
+                "description": "Transformer ajouté manuellement",
+            })
+
+
+class UnifiedGISENGINEInterface(QMainWindow):
+    """Fenêtre principale du workbench GISENGINE."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("GISENGINE Workbench")
+        self.resize(1280, 800)
+        self._runner = None
+        self._runner_thread = None
+        # Initialisés à None : les gardes des handlers deviennent de simples
+        # comparaisons d'attribut au lieu de hasattr à chaque clic.
+        self.workflow_scene = None
+        self.workflow_view = None
+        self.workflow_designer = None
+        self.workflow_log = None
+        self.setup_ui()
+        self.setup_components()
+
+    # ------------------------------------------------------------------
+    # Construction de l'interface
+    # ------------------------------------------------------------------
+
+    def setup_ui(self):
+        splitter = QSplitter(Qt.Horizontal)
+        self.setCentralWidget(splitter)
+
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+        catalog_title = QLabel("🧰 Transformers")
+        catalog_title.setStyleSheet("font-weight: bold; font-size: 13px;")
+        left_layout.addWidget(catalog_title)
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Filtrer les transformers...")
+        _connect_unique(self.search_box.textChanged, self.filter_transformers)
+        left_layout.addWidget(self.search_box)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.transformer_list = QListWidget()
+        self.transformer_list.setDragEnabled(True)
+        left_layout.addWidget(self.transformer_list)
+        self.search_panel = ProfessionalSearchPanel()
+        _connect_unique(self.search_panel.node_requested, self.on_node_requested)
+        left_layout.addWidget(self.search_panel)
+        splitter.addWidget(left_panel)
+
+        self.tabs = QTabWidget()
+        splitter.addWidget(self.tabs)
+        splitter.setSizes([320, 960])
+
+        self.status_message = QLabel("Prêt")
+        self.statusBar().addWidget(self.status_message)
+        # Les mises à jour de statut passent par un timer mono-coup : une
+        # rafale de messages ne peint que le dernier, au lieu d'un
+        # relayout/repaint de la barre par setText.
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        menu = self.menuBar().addMenu("Outils")
+        reload_action = menu.addAction("Recharger les composants")
+        reload_action.triggered.connect(self.reload_components)
+        help_menu = self.menuBar().addMenu("Aide")
+        about_action = help_menu.addAction("À propos")
+        about_action.triggered.connect(self.show_about)
+
+        self.populate_draggable_transformers()
+
+    def setup_components(self):
+        self.tabs.addTab(self.setup_workflow_tab(), "🎨 Designer")
+        self.tabs.addTab(self.create_interactive_workflow_widget(),
+                         "⚡ Canevas rapide")
+        self.tabs.addTab(self.create_simple_processing_widget(), "⚙️ Traitements")
+        self.tabs.addTab(self.create_log_widget(), "📋 Journal")
+
+    def setup_workflow_tab(self):
+        # Le FMEWorkflowDesigner est une QMainWindow complète (menus, barres
+        # d'outils, docks) : sa construction est repoussée après l'affichage
+        # de la fenêtre principale pour ne pas retarder l'ouverture.
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        placeholder = QLabel("Chargement du designer…")
+        placeholder.setAlignment(Qt.AlignCenter)
+        layout.addWidget(placeholder)
+        self._designer_container = container
+        self._designer_placeholder = placeholder
+        QTimer.singleShot(0, self._create_workflow_designer)
+        return container
+
+    def _create_workflow_designer(self):
+        container = self._designer_container
+        if container is None:
+            return
+        try:
+            from .workflow_designer import FMEWorkflowDesigner
+            self.workflow_designer = FMEWorkflowDesigner()
+            central = self.workflow_designer.centralWidget()
+            central.setParent(container)
+            self._designer_placeholder.hide()
+            self._designer_placeholder.deleteLater()
+            self._designer_placeholder = None
+            container.layout().addWidget(central)
+        except Exception as e:
+            container.layout().addWidget(self.create_error_widget(
+                "Impossible de charger le designer : {}".format(e)))
+
+    def create_interactive_workflow_widget(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+
+        toolbar_layout = QHBoxLayout()
+        add_input_btn = QPushButton("➕ Entrée")
+        add_input_btn.clicked.connect(self.add_quick_input)
+        toolbar_layout.addWidget(add_input_btn)
+        add_output_btn = QPushButton("➕ Sortie")
+        add_output_btn.clicked.connect(self.add_quick_output)
+        toolbar_layout.addWidget(add_output_btn)
+        clear_btn = QPushButton("🧹 Effacer")
+        clear_btn.clicked.connect(self.clear_workflow_canvas)
+        toolbar_layout.addWidget(clear_btn)
+        validate_btn = QPushButton("✔ Valider")
+        validate_btn.clicked.connect(self.validate_workflow)
+        toolbar_layout.addWidget(validate_btn)
+        execute_btn = QPushButton("▶ Exécuter")
+        execute_btn.clicked.connect(self.execute_workflow)
+        toolbar_layout.addWidget(execute_btn)
+        toolbar_layout.addStretch()
+        self.nodes_label = QLabel("Nœuds : 0")
+        toolbar_layout.addWidget(self.nodes_label)
+        self.connections_label = QLabel("Connexions : 0")
+        toolbar_layout.addWidget(self.connections_label)
+        layout.addLayout(toolbar_layout)
+
+        self.workflow_scene = ModernWorkflowScene()
+        self.workflow_scene.set_transformer_data(_TRANSFORMERS_CATALOG)
+        _connect_unique(self.workflow_scene.node_added,
+                        self.on_workflow_node_added)
+        self.workflow_view = QGraphicsView(self.workflow_scene)
+        layout.addWidget(self.workflow_view)
+        return widget
+
+    def create_simple_processing_widget(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        results_area = QTextEdit()
+        results_area.setReadOnly(True)
+        results_area.setPlainText(_PROCESSING_RESULTS_TEXT)
+        layout.addWidget(results_area)
+        return widget
+
+    def create_log_widget(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        self.workflow_log = QTextEdit()
+        self.workflow_log.setReadOnly(True)
+        # Journal borné : Qt jette les blocs les plus anciens, le coût de
+        # mise en page reste O(200) au lieu de croître avec la session.
+        self.workflow_log.document().setMaximumBlockCount(200)
+        layout.addWidget(self.workflow_log)
+        return widget
+
+    def create_error_widget(self, message):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        header = QLabel("⚠️ Erreur de chargement")
+        header.setStyleSheet(_ERROR_HEADER_QSS)
+        layout.addWidget(header)
+        label = QLabel(message)
+        label.setWordWrap(True)
+        label.setStyleSheet(_ERROR_LABEL_QSS)
+        layout.addWidget(label)
+        reload_btn = QPushButton("🔄 Recharger")
+        reload_btn.setStyleSheet(_ERROR_BTN_QSS)
+        reload_btn.clicked.connect(self.reload_components)
+        layout.addWidget(reload_btn)
+        layout.addStretch()
+        return widget
+
+    # ------------------------------------------------------------------
+    # Catalogue de transformers
+    # ------------------------------------------------------------------
+
+    def populate_draggable_transformers(self):
+        lst = self.transformer_list
+        lst.setUpdatesEnabled(False)
+        lst.model().blockSignals(True)
+        try:
+            for category, entries in _TRANSFORMERS_BY_CATEGORY.items():
+                header = QListWidgetItem("— {} —".format(category))
+                header.setFlags(Qt.NoItemFlags)
+                lst.addItem(header)
+                for name, category, icon, description in entries:
+                    lst.addItem(DraggableTransformerItem(
+                        name, category, icon, description))
+        finally:
+            lst.model().blockSignals(False)
+            # Les rowsInserted ont été avalés pendant le blocage : la vue
+            # doit être resynchronisée explicitement avec le modèle.
+            lst.model().layoutChanged.emit()
+            lst.setUpdatesEnabled(True)
+
+    def filter_transformers(self, text):
+        # Débounce : on ne filtre qu'une fois la saisie stabilisée.
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        lst = self.transformer_list
+        query = self.search_box.text().lower()
+        category = None
+        if ":" in query:
+            # Raccourci « catégorie:texte » : restreint d'abord à la
+            # catégorie, le reste de la requête filtre comme d'habitude.
+            prefix, rest = query.split(":", 1)
+            category = _CATEGORY_PREFIXES.get(prefix.strip())
+            if category is not None:
+                query = rest
+        tokens = query.split()
+        if not tokens and category is None:
+            for i in range(lst.count()):
+                item = lst.item(i)
+                if item.isHidden():
+                    item.setHidden(False)
+            return
+        # Correspondance floue multi-jetons : « vector buffer » matche tout
+        # élément contenant les jetons dans l'ordre, via une seule regex C.
+        search = (re.compile(".*?".join(map(re.escape, tokens))).search
+                  if tokens else None)
+        for i in range(lst.count()):
+            item = lst.item(i)
+            if not getattr(item, "_is_transformer", False):
+                # En-têtes de section : masqués pendant un filtrage actif.
+                hidden = True
+            elif category is not None and item.transformer_category != category:
+                hidden = True
+            else:
+                hidden = (search is not None
+                          and search(item._search_blob) is None)
+            # setHidden invalide la mise en page même sans changement :
+            # on ne le déclenche que quand la visibilité bascule vraiment.
+            if item.isHidden() != hidden:
+                item.setHidden(hidden)
+
+    def _set_status(self, message):
+        self._pending_status = message
+        self._status_timer.start()
+
+    def _flush_status(self):
+        if self._pending_status is not None:
+            self.status_message.setText(self._pending_status)
+            self._pending_status = None
+
+    # ------------------------------------------------------------------
+    # Actions sur le canevas de workflow
+    # ------------------------------------------------------------------
+
+    def add_quick_input(self):
+        if self.workflow_scene is None:
+            return
+        count = len(self.workflow_scene.nodes)
+        self.workflow_scene.add_node(
+            "Entrée {}".format(count + 1), "input", 80, 80 + count * 90)
+
+    def add_quick_output(self):
+        if self.workflow_scene is None:
+            return
+        count = len(self.workflow_scene.nodes)
+        self.workflow_scene.add_node(
+            "Sortie {}".format(count + 1), "output", 720, 80 + count * 90)
+
+    def on_node_requested(self, data):
+        # Le panneau émet des Component immuables ; le designer et la scène
+        # attendent l'interface dict, on ne convertit qu'à la frontière.
+        # Seuls les champs sérialisables passent dans node_data : display,
+        # icon et hay sont dérivés pour l'affichage et feraient échouer
+        # json.dump à l'enregistrement du workflow.
+        if isinstance(data, Component):
+            data = {"type": data.type, "name": data.name,
+                    "category": data.category,
+                    "description": data.description}
+        if self.workflow_designer is not None:
+            self.workflow_designer.add_node_to_scene(data)
+            return
+        if self.workflow_scene is not None:
+            count = len(self.workflow_scene.nodes)
+            node_type = data.get("type", "transformer")
+            if node_type == "reader":
+                node_type = "input"
+            elif node_type == "writer":
+                node_type = "output"
+            self.workflow_scene.add_node(
+                data.get("name", "Node"), node_type, 400, 80 + count * 90)
+
+    def clear_workflow_canvas(self):
+        if self.workflow_scene is None:
+            return
+        # Un seul clear() côté C++ plutôt qu'un delete() par item,
+        # avec les repeints suspendus pendant le retrait.
+        self.workflow_view.setUpdatesEnabled(False)
+        try:
+            self.workflow_scene.clear()
+            self.workflow_scene.nodes.clear()
+            self.workflow_scene.connection_count = 0
+        finally:
+            self.workflow_view.setUpdatesEnabled(True)
+        self.on_elements_deleted()
+        self.workflow_log.append("Canevas effacé")
+        self._set_status("Canevas effacé")
+
+    def validate_workflow(self):
+        inputs = 0
+        outputs = 0
+        for item in self.workflow_scene.items():
+            if getattr(item, "_is_workflow_node", False):
+                if item.node_type == "input":
+                    inputs += 1
+                elif item.node_type == "output":
+                    outputs += 1
+        if inputs == 0 or outputs == 0:
+            message = "⚠️ Workflow incomplet : il faut au moins une entrée et une sortie"
+        else:
+            message = "✔ Workflow valide ({} entrées, {} sorties)".format(
+                inputs, outputs)
+        self.workflow_log.append(message)
+        self._set_status(message)
+
+    def execute_workflow(self):
+        if self.workflow_designer is None:
+            logger.warning("Exécution demandée sans designer initialisé")
+            return
+        if self._runner_thread is not None:
+            return  # une exécution est déjà en cours
+        self.workflow_log.append("▶ Exécution du workflow")
+        # L'exécution part dans un QThread : la boucle d'événements
+        # reste vivante, l'UI affiche l'avancement via les signaux.
+        self._runner_thread = QThread(self)
+        # Les données de scène sont capturées ici, sur le thread GUI :
+        # QGraphicsScene n'est pas lisible depuis un autre thread.
+        self._runner = WorkflowRunner(
+            self.workflow_designer.scene.get_scene_data())
+        self._runner.moveToThread(self._runner_thread)
+        self._runner_thread.started.connect(self._runner.run)
+        self._runner.progress.connect(self._set_status)
+        self._runner.finished.connect(self._on_workflow_finished)
+        self._runner_thread.start()
+
+    def _on_workflow_finished(self, success):
+        message = "Exécution terminée" if success else "Échec de l'exécution"
+        self._set_status(message)
+        self.workflow_log.append(message)
+        self._runner_thread.quit()
+        self._runner_thread.wait()
+        self._runner_thread.deleteLater()
+        self._runner_thread = None
+        self._runner = None
+
+    def on_workflow_node_added(self, node):
+        ttime = time.strftime("%H:%M:%S")
+        self.workflow_log.append(
+            "[{}] Nœud ajouté : {}".format(ttime, node.node_name))
+        self.nodes_label.setText(
+            "Nœuds : {}".format(len(self.workflow_scene.nodes)))
+        self._set_status("Nœud « {} » ajouté".format(node.node_name))
+
+    def on_elements_deleted(self):
+        scene = self.workflow_scene
+        self.nodes_label.setText("Nœuds : {}".format(len(scene.nodes)))
+        self.connections_label.setText(
+            "Connexions : {}".format(scene.connection_count))
+
+    # ------------------------------------------------------------------
+    # Divers
+    # ------------------------------------------------------------------
+
+    def reload_components(self):
+        # tabs.clear() ne détruit pas les pages : l'arbre parent de Qt garde
+        # les anciens scène/vue/journal vivants jusqu'au GC. On coupe les
+        # références croisées explicitement pour que les rechargements
+        # répétés ne fassent pas gonfler la mémoire.
+        for attr in ("workflow_scene", "workflow_view", "workflow_log",
+                     "workflow_designer"):
+            old = getattr(self, attr, None)
+            if old is not None:
+                old.deleteLater()
+                setattr(self, attr, None)
+        self.tabs.clear()
+        self.setup_components()
+        self._set_status("Composants rechargés")
+
+    def show_about(self):
+        QMessageBox.information(self, "À propos", _ABOUT_HTML)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Fenêtre du designer de workflow FME-style."""
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import (
+    QDockWidget,
+    QFileDialog,
+    QGraphicsView,
+    QLabel,
+    QMainWindow,
+    QMessageBox,
+)
+
+from .workflow_scene import FMEStyleScene
+
+# Décalages de placement précalculés sur un réseau à faible divergence
+# (fractions de nombres irrationnels) : déterministes, mieux répartis que
+# des tirages aléatoires, et aucun appel à random par insertion.
+_JITTER = tuple(
+    (int(50 * ((i * 0.618) % 1 - 0.5) * 2),
+     int(50 * ((i * 0.414) % 1 - 0.5) * 2))
+    for i in range(64)
+)
+
+# Feuille de style unique du designer, parsée par Qt une seule fois et
+# appliquée au niveau de la fenêtre : les sélecteurs par objectName évitent
+# la cascade de re-style qu'entraînent des setStyleSheet par widget.
+_QSS = """
+    QMainWindow { background: #ffffff; }
+    QToolBar {
+        background: #f8f9fa;
+        border-bottom: 1px solid #dee2e6;
+        spacing: 4px;
+    }
+    QStatusBar { background: #f8f9fa; }
+    QGraphicsView#workflowView {
+        border: 1px solid #dee2e6;
+        background: #f8f9fa;
+    }
+    QLabel#propertiesPanel {
+        background: white;
+        border: 1px solid #dee2e6;
+        padding: 8px;
+        color: #495057;
+    }
+"""
+
+
+def workflow_status(data):
+    """Valide un instantané de scène et renvoie (succès, message).
+
+    Opère sur les données sérialisées, pas sur la scène : la fonction
+    est donc utilisable depuis un thread de travail.
+    """
+    nodes = data["nodes"]
+    readers = sum(1 for n in nodes if n["data"].get("type") == "reader")
+    writers = sum(1 for n in nodes if n["data"].get("type") == "writer")
+    if readers == 0 or writers == 0:
+        return False, "Workflow incomplet : reader et writer requis"
+    return True, "Exécution de {} nœuds...".format(len(nodes))
+
+
+class FMEWorkflowDesigner(QMainWindow):
+    """Fenêtre principale du designer : scène, barre d'outils, propriétés."""
+
+    # Mode de rafraîchissement du viewport, exposé en attribut de classe.
+    # La scène compte des dizaines de gros nœuds aux boundingRect exacts :
+    # ne repeindre que les régions exposées bat largement le repaint
+    # intégral pendant les déplacements.
+    VIEWPORT_UPDATE_MODE = QGraphicsView.MinimalViewportUpdate
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Designer de workflow FME")
+        self.resize(1100, 750)
+        self.setStyleSheet(_QSS)
+        self.setup_scene_and_view()
+        self.create_actions()
+        self.create_properties_panel()
+        # Étiquette permanente : setText programme un repaint asynchrone,
+        # là où showMessage() redessine la barre de façon synchrone à
+        # chaque action utilisateur.
+        self._status_label = QLabel("Prêt")
+        self.statusBar().addPermanentWidget(self._status_label, 1)
+        # Messages de statut coalescés : pendant une rafale d'actions seul
+        # le dernier texte est réellement peint, au plus toutes les 50 ms.
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
+        self._insert_counter = 0
+
+    def _set_status(self, message):
+        self._pending_status = message
+        self._status_timer.start()
+
+    def _flush_status(self):
+        if self._pending_status is not None:
+            self._status_label.setText(self._pending_status)
+            self._pending_status = None
+
+    def setup_scene_and_view(self):
+        self.scene = FMEStyleScene(self)
+        self.view = QGraphicsView(self.scene)
+        self.view.setRenderHint(QPainter.Antialiasing, True)
+        self.scene.attach_view_fast_mode(self.view, self.VIEWPORT_UPDATE_MODE)
+        self.view.setDragMode(QGraphicsView.RubberBandDrag)
+        self.view.setObjectName("workflowView")
+        self.setCentralWidget(self.view)
+
+    def create_actions(self):
+        toolbar = self.addToolBar("Workflow")
+        toolbar.setMovable(False)
+        actions = (
+            ("🗋 Nouveau", self.new_workflow),
+            ("📂 Ouvrir", self.open_workflow),
+            ("💾 Enregistrer", self.save_workflow),
+            ("🔍+ Zoom", self.zoom_in),
+            ("🔍- Zoom", self.zoom_out),
+            ("⬜ Ajuster", self.zoom_to_fit),
+            ("☑ Tout sélectionner", self.select_all_action),
+            ("🗑 Supprimer", self.delete_action),
+            ("# Grille", self.toggle_grid),
+            ("▶ Exécuter", self.run_workflow),
+        )
+        for text, slot in actions:
+            action = toolbar.addAction(text)
+            action.triggered.connect(slot)
+
+    def create_properties_panel(self):
+        dock = QDockWidget("Propriétés", self)
+        dock.setFeatures(QDockWidget.DockWidgetMovable)
+        self.properties_label = QLabel("Sélectionnez un nœud pour voir "
+                                       "ses propriétés.")
+        self.properties_label.setWordWrap(True)
+        self.properties_label.setObjectName("propertiesPanel")
+        dock.setWidget(self.properties_label)
+        self.addDockWidget(Qt.RightDockWidgetArea, dock)
+
+    # ------------------------------------------------------------------
+    # Actions
+    # ------------------------------------------------------------------
+
+    def add_node_to_scene(self, node_data):
+        dx, dy = _JITTER[self._insert_counter & 63]
+        self._insert_counter += 1
+        node = self.scene.add_node_from_data(node_data, 400 + dx, 300 + dy)
+        self._set_status(
+            "Ajout de {} au workflow".format(node_data.get("name", "?")))
+        return node
+
+    def new_workflow(self):
+        self.scene.clear_scene()
+        self._set_status("Nouveau workflow")
+
+    def open_workflow(self):
+        # Imports différés : json/os ne servent qu'aux dialogues de
+        # fichiers, inutile de les payer au chargement du module UI
+        # (sys.modules rend les appels suivants gratuits).
+        import json
+        import os
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Ouvrir un workflow", os.path.expanduser("~"),
+            "Workflows GISENGINE (*.json)")
+        if not path:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Ouverture impossible", str(e))
+            return
+        self.scene.load_scene_data(data)
+        self._set_status("Workflow chargé : {}".format(path))
+
+    def save_workflow(self):
+        import json
+        import os
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Enregistrer le workflow", os.path.expanduser("~"),
+            "Workflows GISENGINE (*.json)")
+        if not path:
+            return
+        data = self.scene.get_scene_data()
+        try:
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, indent=2, ensure_ascii=False)
+        except OSError as e:
+            QMessageBox.warning(self, "Enregistrement impossible", str(e))
+            return
+        self._set_status("Workflow enregistré : {}".format(path))
+
+    def select_all_action(self):
+        # Même chemin que le Ctrl-A de la scène : sélection des nœuds via
+        # le registre, un seul selectionChanged pour le lot.
+        self.scene.select_all_nodes()
+        self._set_status("Tout est sélectionné")
+
+    def delete_action(self):
+        self.scene.delete_selected_items()
+        self._set_status("Éléments supprimés")
+
+    def zoom_in(self):
+        self.view.scale(1.2, 1.2)
+        self._set_status("Zoom avant")
+
+    def zoom_out(self):
+        self.view.scale(1 / 1.2, 1 / 1.2)
+        self._set_status("Zoom arrière")
+
+    def zoom_to_fit(self):
+        # Différé d'un tour de boucle : le fitInView et la mise à jour du
+        # statut sont rendus dans la même passe de peinture au lieu de
+        # deux repaints successifs.
+        QTimer.singleShot(0, self._do_zoom_to_fit)
+
+    def _do_zoom_to_fit(self):
+        self.view.fitInView(self.scene.itemsBoundingRect(),
+                            Qt.KeepAspectRatio)
+        self._set_status("Zoom ajusté au contenu")
+
+    def toggle_grid(self):
+        self.scene.show_grid = not self.scene.show_grid
+        # update() ne suffit pas : le fond est mis en cache côté vue.
+        self.scene.invalidate_grid()
+        self._set_status(
+            "Grille affichée" if self.scene.show_grid else "Grille masquée")
+
+    def run_workflow(self):
+        success, message = workflow_status(self.scene.get_scene_data())
+        self._set_status(message)
+        return success
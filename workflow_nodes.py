@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+"""Éléments graphiques du designer FME : nœuds, ports et connexions."""
+
+import math
+import sys
+
+from PyQt5.QtCore import QPointF, QTimer
+from PyQt5.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QLinearGradient,
+    QPainter,
+    QPainterPath,
+    QPainterPathStroker,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+    QPolygonF,
+    QStaticText,
+    QTransform,
+)
+from PyQt5.QtWidgets import (
+    QGraphicsEllipseItem,
+    QGraphicsItem,
+    QGraphicsPathItem,
+    QGraphicsRectItem,
+)
+from PyQt5.QtCore import Qt
+
+
+# Positions verticales des ports, mémoïsées par nombre de ports : les
+# nœuds de même gabarit (entrées, sorties) réutilisent le même tuple au
+# lieu de recalculer la disposition à chaque construction.
+_PORT_YS_CACHE = {}
+
+
+def _port_y_positions(count):
+    ys = _PORT_YS_CACHE.get(count)
+    if ys is None:
+        if count <= 1:
+            ys = (40,)
+        else:
+            ys = tuple(20 + i * 40 for i in range(count))
+        _PORT_YS_CACHE[count] = ys
+    return ys
+
+
+# Couples de couleurs (haut, bas) du dégradé, par type de nœud.
+_NODE_GRADIENTS = {
+    "reader": ("#28a745", "#1e7e34"),
+    "writer": ("#dc3545", "#bd2130"),
+    "transformer": ("#007bff", "#0062cc"),
+}
+
+# Stylos partagés par tous les nœuds : valeurs immuables pour notre usage,
+# inutile d'en allouer trois par instance.
+_NODE_PEN_NORMAL = QPen(QColor("#dee2e6"), 2)
+_NODE_PEN_SELECTED = QPen(QColor("#ffc107"), 3)
+_NODE_PEN_HOVER = QPen(QColor("#80bdff"), 2)
+
+# Police d'étiquette partagée par tous les nœuds.
+_LABEL_FONT = QFont("Segoe UI", 9, QFont.Bold)
+
+# Brosses (normale, survol) et stylo partagés par tous les ports, et
+# stylos des connexions : un jeu de valeurs pour tout le canevas plutôt
+# qu'une allocation par port ou par passe de paint().
+_PORT_BRUSHES = {
+    "input": (QBrush(QColor("#28a745")),
+              QBrush(QColor("#28a745").lighter(130))),
+    "output": (QBrush(QColor("#007bff")),
+               QBrush(QColor("#007bff").lighter(130))),
+}
+_PORT_PEN = QPen(QColor("white"), 2)
+_CONN_PEN = QPen(QColor("#4A90E2"), 2)
+_CONN_PEN_SELECTED = QPen(QColor("#ffc107"), 3)
+_CONN_SHADOW_PEN = QPen(QColor(0, 0, 0, 30), 4)
+
+
+class ProfessionalWorkflowNode(QGraphicsRectItem):
+    """Nœud de workflow avec dégradé, ports d'entrée/sortie et étiquette."""
+
+    # Une brosse dégradée par type de nœud, construite à la demande et
+    # partagée par toutes les instances du même type.
+    _BRUSH_CACHE = {}
+
+    # Identifiant entier stable par session : sérialisable, contrairement
+    # à id() qui expose une adresse mémoire réutilisable.
+    _next_id = 0
+
+    @classmethod
+    def _brush_for(cls, node_type):
+        brush = cls._BRUSH_CACHE.get(node_type)
+        if brush is None:
+            top, bottom = _NODE_GRADIENTS.get(
+                node_type, _NODE_GRADIENTS["transformer"])
+            gradient = QLinearGradient(0, 0, 0, 80)
+            gradient.setColorAt(0, QColor(top))
+            gradient.setColorAt(1, QColor(bottom))
+            brush = QBrush(gradient)
+            cls._BRUSH_CACHE[node_type] = brush
+        return brush
+
+    def __init__(self, node_data, x=0, y=0):
+        super().__init__(0, 0, 160, 80)
+        self.node_data = node_data
+        self.node_id = ProfessionalWorkflowNode._next_id
+        ProfessionalWorkflowNode._next_id += 1
+        self.input_ports = []
+        self.output_ports = []
+        # Géométrie mise en cache : boundingRect/shape sont interrogés à
+        # chaque mouvement de souris, inutile de les recalculer tant que la
+        # taille du nœud ne change pas.
+        self._bounding_rect = None
+        self._shape = None
+        self._hovered = False
+        self._update_pending = False
+        # Nombre de connexions rattachées au nœud, tenu à jour par les
+        # ports : permet de court-circuiter itemChange quand il n'y a
+        # aucun chemin à recalculer.
+        self._connection_count = 0
+        self.setPos(x, y)
+        self.setFlag(QGraphicsItem.ItemIsMovable, True)
+        self.setFlag(QGraphicsItem.ItemIsSelectable, True)
+        self.setFlag(QGraphicsItem.ItemSendsScenePositionChanges, True)
+        # Rendu mis en cache en coordonnées périphérique : déplacer un nœud
+        # re-blitte un pixmap au lieu de repasser par paint() pour chaque
+        # nœud exposé. Pas de ItemClipsChildrenToShape ici : les ports
+        # débordent volontairement du corps du nœud.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.setAcceptHoverEvents(True)
+        self.setup_appearance()
+        self.create_ports()
+        self.create_label()
+
+    def setup_appearance(self):
+        node_type = self.node_data.get("type", "transformer")
+        self.setBrush(self._brush_for(node_type))
+        self.pen_normal = _NODE_PEN_NORMAL
+        self.pen_selected = _NODE_PEN_SELECTED
+        self.pen_hover = _NODE_PEN_HOVER
+        self.setPen(self.pen_normal)
+        self._bounding_rect = None
+        self._shape = None
+
+    def boundingRect(self):
+        if self._bounding_rect is None:
+            # Corps + demi-épaisseur du stylo sélection + ombre (3, 3).
+            self._bounding_rect = self.rect().adjusted(-2, -2, 5, 5)
+        return self._bounding_rect
+
+    def shape(self):
+        if self._shape is None:
+            path = QPainterPath()
+            path.addRoundedRect(self.rect(), 8, 8)
+            self._shape = path
+        return self._shape
+
+    def create_ports(self):
+        input_count = self.node_data.get("inputs", 1)
+        output_count = self.node_data.get("outputs", 1)
+        for i, y_pos in enumerate(_port_y_positions(input_count)):
+            port = ConnectionPort(self, "input", "input_{}".format(i), -6, y_pos)
+            self.input_ports.append(port)
+        for i, y_pos in enumerate(_port_y_positions(output_count)):
+            port = ConnectionPort(self, "output", "output_{}".format(i), 166, y_pos)
+            self.output_ports.append(port)
+        # Vue aplatie et figée des deux listes : les chemins chauds
+        # itèrent dessus sans concaténation ni allocation.
+        self.all_ports = tuple(self.input_ports + self.output_ports)
+        # Accès par nom en O(1) pour la désérialisation des connexions.
+        self.input_ports_by_name = {p.port_name: p for p in self.input_ports}
+        self.output_ports_by_name = {p.port_name: p for p in self.output_ports}
+
+    def create_label(self):
+        # QStaticText met en cache la disposition des glyphes ; un
+        # QGraphicsTextItem traînerait un QTextDocument complet par nœud.
+        self._label = QStaticText(self.node_data.get("name", "Node"))
+        self._label.setTextFormat(Qt.PlainText)
+        self._label.prepare(QTransform(), _LABEL_FONT)
+
+    def paint(self, painter, option, widget=None):
+        # Le corps (ombre + dégradé + bordure) est rendu une fois par
+        # combinaison (type, taille, état) dans QPixmapCache, puis blitté :
+        # le remplissage alpha par pixel devient une simple copie.
+        rect = self.rect()
+        selected = self.isSelected()
+        key = "gisengine/node:{}:{:.0f}x{:.0f}:{}:{}".format(
+            self.node_data.get("type", "transformer"),
+            rect.width(), rect.height(), int(selected), int(self._hovered))
+        pixmap = QPixmap()
+        if not QPixmapCache.find(key, pixmap):
+            pixmap = self._render_body(selected)
+            QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(-2, -2, pixmap)
+        painter.setFont(_LABEL_FONT)
+        painter.setPen(Qt.white)
+        painter.drawStaticText(8, 8, self._label)
+
+    def _render_body(self, selected):
+        rect = self.rect()
+        # Marges du boundingRect : 2 px à gauche/en haut, 5 px à
+        # droite/en bas (ombre + stylo de sélection).
+        pixmap = QPixmap(int(rect.width()) + 7, int(rect.height()) + 7)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        body = rect.translated(2 - rect.x(), 2 - rect.y())
+        # Remplissages sans anticrénelage : l'intérieur est plein, seul le
+        # contour arrondi profite de l'AA, ce qui divise les pixels
+        # traités par le chemin lent du rasterizer.
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(QColor(0, 0, 0, 40)))
+        painter.drawRoundedRect(body.translated(3, 3), 8, 8)
+        painter.setBrush(self.brush())
+        painter.drawRoundedRect(body, 8, 8)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setBrush(Qt.NoBrush)
+        if selected:
+            painter.setPen(self.pen_selected)
+        elif self._hovered:
+            painter.setPen(self.pen_hover)
+        else:
+            painter.setPen(self.pen_normal)
+        painter.drawRoundedRect(body.adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+        painter.end()
+        return pixmap
+
+    # Le survol change seulement le stylo : un setScale() invaliderait la
+    # géométrie (et donc l'index de la scène) à chaque passage du curseur.
+    def hoverEnterEvent(self, event):
+        self._hovered = True
+        self.update()
+        super().hoverEnterEvent(event)
+
+    def hoverLeaveEvent(self, event):
+        self._hovered = False
+        self.update()
+        super().hoverLeaveEvent(event)
+
+    def itemChange(self, change, value):
+        # ItemPositionChange arrive au rythme des événements souris ; les
+        # chemins ne sont recalculés qu'une fois par tour de boucle
+        # d'événements, quel que soit le nombre de changements cumulés.
+        if change == QGraphicsItem.ItemPositionChange:
+            if self._connection_count and not self._update_pending:
+                self._update_pending = True
+                QTimer.singleShot(0, self._flush_connection_updates)
+        return super().itemChange(change, value)
+
+    def _flush_connection_updates(self):
+        self._update_pending = False
+        scene = self.scene()
+        mark_dirty = getattr(scene, "mark_connections_dirty", None)
+        if mark_dirty is not None:
+            # La scène dédoublonne : une connexion partagée par plusieurs
+            # nœuds déplacés n'est recalculée qu'une fois.
+            mark_dirty(self.all_ports)
+            return
+        for port in self.all_ports:
+            for connection in port.connections.values():
+                connection.update_path()
+
+
+class ConnectionPort(QGraphicsEllipseItem):
+    """Port circulaire d'entrée ou de sortie attaché à un nœud."""
+
+    def __init__(self, parent_node, port_type, port_name, x, y):
+        super().__init__(-6, -6, 12, 12, parent_node)
+        self.parent_node = parent_node
+        self.port_type = port_type
+        self.port_name = port_name
+        # Connexions indexées par id() : ajout et retrait en O(1),
+        # itération via .values().
+        self.connections = {}
+        # Ports déjà reliés à celui-ci : le test de doublon dans
+        # can_connect devient une appartenance O(1).
+        self._peer_ports = set()
+        self.setPos(x, y)
+        self.setAcceptHoverEvents(True)
+        self.setup_appearance()
+
+    def setup_appearance(self):
+        self._brush_normal, self._brush_hover = _PORT_BRUSHES[self.port_type]
+        self.setBrush(self._brush_normal)
+        self.setPen(_PORT_PEN)
+
+    # Même principe que pour le nœud : le survol échange la brosse au lieu
+    # d'agrandir le port, aucune géométrie n'est invalidée.
+    def hoverEnterEvent(self, event):
+        self.setBrush(self._brush_hover)
+        super().hoverEnterEvent(event)
+
+    def hoverLeaveEvent(self, event):
+        self.setBrush(self._brush_normal)
+        super().hoverLeaveEvent(event)
+
+    def mousePressEvent(self, event):
+        scene = self.scene()
+        if scene is not None and hasattr(scene, "handle_port_click"):
+            scene.handle_port_click(self)
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def add_connection(self, connection):
+        self.connections[id(connection)] = connection
+        self.parent_node._connection_count += 1
+        self._peer_ports.add(self._peer_of(connection))
+
+    def remove_connection(self, connection):
+        if self.connections.pop(id(connection), None) is not None:
+            self.parent_node._connection_count -= 1
+            self._peer_ports.discard(self._peer_of(connection))
+
+    def _peer_of(self, connection):
+        if connection.end_port is self:
+            return connection.start_port
+        return connection.end_port
+
+
+class Connection(QGraphicsPathItem):
+    """Courbe de Bézier reliant un port de sortie à un port d'entrée."""
+
+    # Le rasterizer Quartz de macOS dégrade quadratiquement sur les très
+    # longues courbes ; on les découpe alors en sous-cubiques d'environ
+    # 150 px. Ailleurs, le tampon de chemin fixe reste plus rapide.
+    SUBDIVIDE_LONG_CURVES = sys.platform == "darwin"
+
+    def __init__(self, start_port, end_port):
+        super().__init__()
+        self.start_port = start_port
+        self.end_port = end_port
+        self._bounding_rect = None
+        self._shape = None
+        # Tampon de chemin persistant : un moveTo + un cubicTo, dont seules
+        # les positions d'éléments sont réécrites à chaque déplacement.
+        self._path = QPainterPath()
+        self._path.moveTo(0, 0)
+        self._path.cubicTo(0, 0, 0, 0, 0, 0)
+        # Dernières extrémités vues, pour ignorer les déplacements
+        # sous-pixel (sentinelle hors scène au départ).
+        self._last_start = (1e18, 1e18)
+        self._last_end = (1e18, 1e18)
+        # Flèche et ombre recalculées avec le chemin, pas à chaque paint.
+        self._arrow_poly = QPolygonF()
+        self._shadow_path = QPainterPath()
+        self.setFlag(QGraphicsItem.ItemIsSelectable, True)
+        # Les connexions sont statiques entre deux déplacements de nœuds :
+        # le cache en coordonnées périphérique transforme les repaints de
+        # pan en blits, et update_path() invalide le cache quand la courbe
+        # change réellement.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.setZValue(-1)
+        start_port.add_connection(self)
+        end_port.add_connection(self)
+        self.update_path()
+
+    def update_path(self):
+        # L'ellipse du port est centrée sur son origine (-6, -6, 12, 12) :
+        # scenePos() EST le centre, pas besoin de boundingRect().center().
+        start_pos = self.start_port.scenePos()
+        end_pos = self.end_port.scenePos()
+        # Arithmétique sur des flottants locaux plutôt que sur QPointF.
+        sx, sy = start_pos.x(), start_pos.y()
+        ex, ey = end_pos.x(), end_pos.y()
+        last_start = self._last_start
+        last_end = self._last_end
+        if (abs(sx - last_start[0]) + abs(sy - last_start[1])
+                + abs(ex - last_end[0]) + abs(ey - last_end[1])) < 0.5:
+            return
+        self._last_start = (sx, sy)
+        self._last_end = (ex, ey)
+        dx = ex - sx
+        if dx < 83:
+            control_offset = 50.0
+        elif dx > 333:
+            control_offset = 200.0
+        else:
+            control_offset = dx * 0.6
+        # prepareGeometryChange doit précéder le changement de géométrie,
+        # sinon la scène invalide les anciennes bornes après coup.
+        self.prepareGeometryChange()
+        if self.SUBDIVIDE_LONG_CURVES and abs(dx) > 400:
+            path = self._build_subdivided_path(
+                sx, sy, sx + control_offset, sy,
+                ex - control_offset, ey, ex, ey)
+        else:
+            path = self._path
+            path.setElementPositionAt(0, sx, sy)
+            path.setElementPositionAt(1, sx + control_offset, sy)
+            path.setElementPositionAt(2, ex - control_offset, ey)
+            path.setElementPositionAt(3, ex, ey)
+        self.setPath(path)
+        self._shadow_path = path.translated(2, 2)
+        self._update_arrow(sx, sy, ex, ey, control_offset)
+        self._bounding_rect = None
+        self._shape = None
+        self.update()
+
+    @staticmethod
+    def _build_subdivided_path(p0x, p0y, p1x, p1y, p2x, p2y, p3x, p3y):
+        # Découpe exacte : pour chaque segment [t0, t1], les points de
+        # contrôle de la sous-cubique valent B(t0), B(t0) + (t1-t0)/3·B'(t0),
+        # B(t1) - (t1-t0)/3·B'(t1), B(t1).
+        def point(t):
+            u = 1.0 - t
+            return (u * u * u * p0x + 3 * u * u * t * p1x
+                    + 3 * u * t * t * p2x + t * t * t * p3x,
+                    u * u * u * p0y + 3 * u * u * t * p1y
+                    + 3 * u * t * t * p2y + t * t * t * p3y)
+
+        def tangent(t):
+            u = 1.0 - t
+            return (3 * (u * u * (p1x - p0x) + 2 * u * t * (p2x - p1x)
+                         + t * t * (p3x - p2x)),
+                    3 * (u * u * (p1y - p0y) + 2 * u * t * (p2y - p1y)
+                         + t * t * (p3y - p2y)))
+
+        segments = max(2, int(math.ceil(abs(p3x - p0x) / 150.0)))
+        step = 1.0 / segments
+        path = QPainterPath()
+        path.moveTo(p0x, p0y)
+        for i in range(segments):
+            t0 = i * step
+            t1 = t0 + step
+            bx0, by0 = point(t0)
+            bx1, by1 = point(t1)
+            tx0, ty0 = tangent(t0)
+            tx1, ty1 = tangent(t1)
+            third = step / 3.0
+            path.cubicTo(bx0 + third * tx0, by0 + third * ty0,
+                         bx1 - third * tx1, by1 - third * ty1,
+                         bx1, by1)
+        return path
+
+    def _update_arrow(self, sx, sy, ex, ey, control_offset):
+        # Évaluation fermée de la cubique en t=0,5 : milieu B(0,5) et
+        # tangente B'(0,5), sans passer par pointAtPercent qui parcourt
+        # toute la courbe.
+        c1x, c1y = sx + control_offset, sy
+        c2x, c2y = ex - control_offset, ey
+        mid_x = (sx + 3.0 * c1x + 3.0 * c2x + ex) / 8.0
+        mid_y = (sy + 3.0 * c1y + 3.0 * c2y + ey) / 8.0
+        tan_x = ex + c2x - c1x - sx
+        tan_y = ey + c2y - c1y - sy
+        angle = math.atan2(tan_y, tan_x)
+        size = 8
+        mid = QPointF(mid_x, mid_y)
+        wing1 = QPointF(mid_x - size * math.cos(angle - 0.5),
+                        mid_y - size * math.sin(angle - 0.5))
+        wing2 = QPointF(mid_x - size * math.cos(angle + 0.5),
+                        mid_y - size * math.sin(angle + 0.5))
+        self._arrow_poly = QPolygonF([wing1, mid, wing2])
+
+    def boundingRect(self):
+        if self._bounding_rect is None:
+            # Courbe + épaisseur du stylo, ombre (2, 2) et flèche centrale.
+            self._bounding_rect = self.path().boundingRect().adjusted(
+                -8, -8, 10, 10)
+        return self._bounding_rect
+
+    def shape(self):
+        if self._shape is None:
+            stroker = QPainterPathStroker()
+            stroker.setWidth(8)
+            self._shape = stroker.createStroke(self.path())
+        return self._shape
+
+    def paint(self, painter, option, widget=None):
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(_CONN_SHADOW_PEN)
+        painter.drawPath(self._shadow_path)
+        if self.isSelected():
+            painter.setPen(_CONN_PEN_SELECTED)
+        else:
+            painter.setPen(_CONN_PEN)
+        painter.drawPath(self.path())
+        painter.drawPolyline(self._arrow_poly)
+
+    def remove_from_scene(self):
+        self.start_port.remove_connection(self)
+        self.end_port.remove_connection(self)
+        if self.scene() is not None:
+            self.scene().removeItem(self)
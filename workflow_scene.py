@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+"""Scène FME-style : grille, connexions interactives et sérialisation."""
+
+import logging
+from contextlib import contextmanager
+
+from PyQt5.QtCore import QLineF, QPointF, QRectF, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import (
+    QColor,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QTransform,
+)
+from PyQt5.QtWidgets import QGraphicsPathItem, QGraphicsScene, QGraphicsView
+
+from .workflow_nodes import Connection, ConnectionPort, ProfessionalWorkflowNode
+
+logger = logging.getLogger(__name__)
+
+# Transformation identité partagée pour les appels à itemAt : la vue
+# n'applique aucune transformation par item, inutile d'en allouer une
+# par clic.
+_IDENTITY = QTransform()
+
+# Stylo de la connexion temporaire, partagé entre tous les tracés.
+_TEMP_CONN_PEN = QPen(QColor("#007bff"), 2, Qt.DashLine)
+
+
+class _TempConnectionItem(QGraphicsPathItem):
+    """Tracé temporaire au boundingRect fourni par la scène.
+
+    QGraphicsPathItem recalcule son rect en strokant le tracé à chaque
+    setPath ; or les points de contrôle de la courbe du glisser restent
+    dans la boîte englobante de ses extrémités, que la scène connaît déjà
+    et pousse via set_endpoints une fois par mouvement de souris. L'item
+    n'est jamais cible de clic : shape() reste vide pour que le
+    hit-testing l'ignore sans stroker quoi que ce soit.
+    """
+
+    _EMPTY_SHAPE = QPainterPath()
+
+    def __init__(self):
+        super().__init__()
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self._rect = QRectF()
+
+    def set_endpoints(self, sx, sy, ex, ey):
+        rect = QRectF(QPointF(sx, sy), QPointF(ex, ey)).normalized()
+        rect.adjust(-3.0, -3.0, 3.0, 3.0)
+        if rect != self._rect:
+            self.prepareGeometryChange()
+            self._rect = rect
+
+    def boundingRect(self):
+        return self._rect
+
+    def shape(self):
+        return self._EMPTY_SHAPE
+
+
+class FMEStyleScene(QGraphicsScene):
+    """Scène du designer : gère la grille, les nœuds et les connexions."""
+
+    scene_modified = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSceneRect(0, 0, 4000, 3000)
+        # Index BSP explicite : la recherche d'item sous la souris devient
+        # logarithmique, et les boundingRect resserrés des nœuds limitent
+        # le nombre d'items visités par région exposée.
+        self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.grid_size = 20
+        self.show_grid = True
+        # Tuile de grille pré-rendue, construite à la première peinture ;
+        # remettre à None si grid_size change.
+        self._grid_pixmap = None
+        # Tracé temporaire créé une fois et montré/caché à la demande :
+        # pas de trafic addItem/removeItem dans l'index à chaque connexion.
+        self.temp_connection = self._create_temp_connection()
+        # Squelette moveTo+cubicTo réutilisé pendant tout le glisser :
+        # seules les positions des quatre éléments sont réécrites, aucun
+        # QPainterPath ni QPointF n'est alloué par mouvement de souris.
+        path = QPainterPath()
+        path.moveTo(0.0, 0.0)
+        path.cubicTo(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        self._temp_path = path
+        self.connection_start_port = None
+        # Centre du port de départ en coordonnées scène, figé pour la
+        # durée du glisser : le port source ne bouge pas pendant la
+        # création d'une connexion.
+        self._start_center = None
+        self.is_connecting = False
+        # Connexions à recalculer, dédupliquées au niveau de la scène :
+        # un glisser multi-sélection ne met à jour chaque connexion
+        # partagée qu'une seule fois par tour de boucle d'événements.
+        self._dirty_connections = set()
+        self._flush_scheduled = False
+        # Registres des nœuds et connexions vivants : la sérialisation
+        # les parcourt directement, sans filtrer self.items().
+        self.nodes = []
+        self.connections = []
+        # Première vue attachée, mise en cache à la première demande :
+        # views() reconstruit une liste à chaque appel.
+        self._primary_view = None
+
+    @contextmanager
+    def bulk_changes(self):
+        """Suspend l'index BSP le temps d'une mutation en masse.
+
+        Chaque ajout/retrait/sélection met l'index à jour ; pour N items
+        cela coûte N rééquilibrages. L'index est débranché pendant le
+        bloc puis reconstruit une seule fois à la sortie.
+        """
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            yield
+        finally:
+            self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+
+    def _view(self):
+        view = self._primary_view
+        if view is None:
+            views = self.views()
+            if views:
+                view = self._primary_view = views[0]
+        return view
+
+    def attach_view_fast_mode(self, view, update_mode=None):
+        """Applique à une vue les réglages de repeinture du designer.
+
+        À appeler juste après la construction de la vue. Par défaut les
+        repaints sont bornés à un seul rect englobant coalescé par frame
+        (BoundingRectViewportUpdate) : SmartViewportUpdate devient
+        pessimiste quand ports, connexions et nœuds émettent beaucoup de
+        petites régions qui se recouvrent pendant un glisser. Pour une
+        scène ultra-dense, passer QGraphicsView.FullViewportUpdate.
+        """
+        if update_mode is None:
+            update_mode = QGraphicsView.BoundingRectViewportUpdate
+        view.setViewportUpdateMode(update_mode)
+        # Le fond (grille) est mis en cache côté vue : le défilement le
+        # blitte depuis le cache au lieu de rappeler drawBackground.
+        # drawBackground ne modifie pas l'état du painter sans le
+        # restaurer, condition requise avec DontSavePainterState.
+        view.setCacheMode(QGraphicsView.CacheBackground)
+        view.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        view.setOptimizationFlag(
+            QGraphicsView.DontAdjustForAntialiasing, True)
+
+    # ------------------------------------------------------------------
+    # Grille de fond
+    # ------------------------------------------------------------------
+
+    def _grid_tile(self):
+        if self._grid_pixmap is None:
+            # Une tuile de 10×10 cellules rendue une seule fois ; le fond
+            # est ensuite blitté en une passe par drawTiledPixmap au lieu
+            # de régénérer des centaines de QLineF à chaque repaint.
+            side = self.grid_size * 10
+            pixmap = QPixmap(side, side)
+            pixmap.fill(QColor("#f8f9fa"))
+            painter = QPainter(pixmap)
+            painter.setPen(QPen(QColor("#e9ecef"), 1, Qt.DotLine))
+            for offset in range(0, side, self.grid_size):
+                painter.drawLine(offset, 0, offset, side)
+                painter.drawLine(0, offset, side, offset)
+            painter.end()
+            self._grid_pixmap = pixmap
+        return self._grid_pixmap
+
+    def invalidate_grid(self):
+        """Force la repeinture du fond après un changement de grille.
+
+        Avec CacheBackground actif sur les vues, update() ne repeint que
+        la couche des items : le fond mis en cache doit être invalidé
+        explicitement. À appeler après toute bascule de show_grid ou
+        changement de grid_size (avec _grid_pixmap remis à None).
+        """
+        self.invalidate(self.sceneRect(), QGraphicsScene.BackgroundLayer)
+
+    def drawBackground(self, painter, rect):
+        if not self.show_grid:
+            painter.fillRect(rect, QColor("#f8f9fa"))
+            return
+        tile = self._grid_tile()
+        side = tile.width()
+        painter.drawTiledPixmap(
+            rect, tile, QPointF(rect.left() % side, rect.top() % side))
+
+    def _create_temp_connection(self):
+        item = _TempConnectionItem()
+        item.setPen(_TEMP_CONN_PEN)
+        item.setZValue(100)
+        item.hide()
+        self.addItem(item)
+        return item
+
+    def mark_connections_dirty(self, ports):
+        dirty = self._dirty_connections
+        for port in ports:
+            dirty.update(port.connections.values())
+        if dirty and not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_dirty_connections)
+
+    def _flush_dirty_connections(self):
+        self._flush_scheduled = False
+        dirty = self._dirty_connections
+        for connection in dirty:
+            connection.update_path()
+        dirty.clear()
+
+    # ------------------------------------------------------------------
+    # Nœuds
+    # ------------------------------------------------------------------
+
+    def add_node_from_data(self, node_data, x, y):
+        # Alignement sur la grille en arithmétique entière : pas de
+        # division flottante ni d'appel à round() par dépôt.
+        gs = self.grid_size
+        half = gs >> 1
+        grid_x = (int(x) + half) // gs * gs
+        grid_y = (int(y) + half) // gs * gs
+        node = ProfessionalWorkflowNode(node_data, grid_x, grid_y)
+        self.addItem(node)
+        self.nodes.append(node)
+        self.scene_modified.emit()
+        return node
+
+    # ------------------------------------------------------------------
+    # Connexions interactives
+    # ------------------------------------------------------------------
+
+    def handle_port_click(self, port):
+        logger.debug("Port cliqué : %s (%s)", port.port_name, port.port_type)
+        if not self.is_connecting:
+            if port.port_type == "output":
+                self.start_connection(port)
+        else:
+            if (port.port_type == "input"
+                    and self.can_connect(self.connection_start_port, port)):
+                self.finish_connection(port)
+            else:
+                self.cleanup_temp_connection()
+
+    def start_connection(self, port):
+        self.connection_start_port = port
+        # L'ellipse du port est centrée sur son origine : scenePos()
+        # renvoie directement le centre.
+        self._start_center = port.scenePos()
+        self.is_connecting = True
+        # Replie le squelette sur le point de départ pour ne pas faire
+        # apparaître la courbe du glisser précédent.
+        path = self._temp_path
+        sx, sy = self._start_center.x(), self._start_center.y()
+        for index in range(4):
+            path.setElementPositionAt(index, sx, sy)
+        self.temp_connection.set_endpoints(sx, sy, sx, sy)
+        self.temp_connection.setPath(path)
+        self.temp_connection.show()
+        view = self._view()
+        if view is not None:
+            view.setCursor(Qt.CrossCursor)
+
+    def update_temp_connection(self, scene_pos):
+        start_pos = self._start_center
+        sx, sy = start_pos.x(), start_pos.y()
+        ex, ey = scene_pos.x(), scene_pos.y()
+        half_dx = (ex - sx) * 0.5
+        path = self._temp_path
+        path.setElementPositionAt(0, sx, sy)
+        path.setElementPositionAt(1, sx + half_dx, sy)
+        path.setElementPositionAt(2, ex - half_dx, ey)
+        path.setElementPositionAt(3, ex, ey)
+        self.temp_connection.set_endpoints(sx, sy, ex, ey)
+        self.temp_connection.setPath(path)
+
+    def can_connect(self, start_port, end_port):
+        if start_port is None or end_port is None:
+            logger.debug("Connexion refusée : port manquant")
+            return False
+        if start_port.parent_node is end_port.parent_node:
+            logger.debug("Connexion refusée : même nœud")
+            return False
+        if start_port.port_type != "output" or end_port.port_type != "input":
+            logger.debug("Connexion refusée : sens invalide")
+            return False
+        if start_port in end_port._peer_ports:
+            logger.debug("Connexion refusée : doublon")
+            return False
+        return True
+
+    def finish_connection(self, end_port):
+        connection = Connection(self.connection_start_port, end_port)
+        self.addItem(connection)
+        self.connections.append(connection)
+        logger.debug("Connexion créée : %s -> %s",
+                     self.connection_start_port.port_name,
+                     end_port.port_name)
+        self.cleanup_temp_connection()
+        self.scene_modified.emit()
+
+    def cleanup_temp_connection(self):
+        self.temp_connection.hide()
+        self.connection_start_port = None
+        self._start_center = None
+        self.is_connecting = False
+        view = self._view()
+        if view is not None:
+            view.setCursor(Qt.ArrowCursor)
+
+    # ------------------------------------------------------------------
+    # Événements
+    # ------------------------------------------------------------------
+
+    def mousePressEvent(self, event):
+        item = self.itemAt(event.scenePos(), _IDENTITY)
+        if isinstance(item, ConnectionPort):
+            self.handle_port_click(item)
+            event.accept()
+            return
+        if self.is_connecting:
+            self.cleanup_temp_connection()
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        # is_connecting implique un port de départ et un tracé valides ;
+        # pendant le glisser de connexion les items n'ont pas à recevoir
+        # les mouvements, inutile de remonter à super().
+        if self.is_connecting:
+            self.update_temp_connection(event.scenePos())
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Delete:
+            self.delete_selected_items()
+        elif (event.key() == Qt.Key_A
+                and event.modifiers() & Qt.ControlModifier):
+            self.select_all_nodes()
+        else:
+            super().keyPressEvent(event)
+
+    def select_all_nodes(self):
+        # Le registre des nœuds évite de parcourir self.items() (ports,
+        # connexions, tracé temporaire compris) avec un isinstance par
+        # item ; selectionChanged n'est émis qu'une fois pour le lot.
+        self.blockSignals(True)
+        for node in self.nodes:
+            node.setSelected(True)
+        self.blockSignals(False)
+        self.selectionChanged.emit()
+
+    def delete_selected_items(self):
+        selected = self.selectedItems()
+        if not selected:
+            return
+        # Le set déduplique : une connexion dont les deux extrémités sont
+        # supprimées (ou qui est elle-même sélectionnée) n'est retirée
+        # qu'une seule fois.
+        doomed_nodes = []
+        doomed_connections = set()
+        for item in selected:
+            if isinstance(item, ProfessionalWorkflowNode):
+                doomed_nodes.append(item)
+                for port in item.all_ports:
+                    doomed_connections.update(port.connections.values())
+            elif isinstance(item, Connection):
+                doomed_connections.add(item)
+        # Repaints suspendus le temps du lot : une seule repeinture à la
+        # fin au lieu d'une invalidation par removeItem.
+        views = self.views()
+        for view in views:
+            view.setUpdatesEnabled(False)
+        try:
+            self._dirty_connections -= doomed_connections
+            for connection in doomed_connections:
+                self._remove_connection(connection)
+            for node in doomed_nodes:
+                self.removeItem(node)
+                self.nodes.remove(node)
+        finally:
+            for view in views:
+                view.setUpdatesEnabled(True)
+        self.scene_modified.emit()
+
+    def _remove_connection(self, connection):
+        connection.remove_from_scene()
+        try:
+            self.connections.remove(connection)
+        except ValueError:
+            pass
+
+    def clear_scene(self):
+        self.cleanup_temp_connection()
+        # Vues détachées le temps de la purge : clear() détruit les
+        # items un par un et chaque destruction notifierait sinon les
+        # vues ; réattacher ne coûte qu'une transition vers la scène
+        # vide.
+        views = self.views()
+        for view in views:
+            view.setScene(None)
+        with self.bulk_changes():
+            self.clear()
+        # clear() a détruit le tracé temporaire avec le reste.
+        self.temp_connection = self._create_temp_connection()
+        self.nodes = []
+        self.connections = []
+        self._dirty_connections.clear()
+        for view in views:
+            view.setScene(self)
+        self.scene_modified.emit()
+
+    # ------------------------------------------------------------------
+    # Sérialisation
+    # ------------------------------------------------------------------
+
+    def get_scene_data(self):
+        nodes_data = [
+            {
+                "id": node.node_id,
+                "data": node.node_data,
+                "position": {"x": node.x(), "y": node.y()},
+            }
+            for node in self.nodes
+        ]
+        connections_data = [
+            {
+                "start_node": connection.start_port.parent_node.node_id,
+                "start_port": connection.start_port.port_name,
+                "end_node": connection.end_port.parent_node.node_id,
+                "end_port": connection.end_port.port_name,
+            }
+            for connection in self.connections
+        ]
+        return {"nodes": nodes_data, "connections": connections_data}
+
+    def load_scene_data(self, data):
+        self.clear_scene()
+        with self.bulk_changes():
+            self._load_items(data)
+        self.scene_modified.emit()
+
+    def _load_items(self, data):
+        nodes_by_id = {}
+        gs = self.grid_size
+        half = gs >> 1
+        for node_info in data.get("nodes", []):
+            position = node_info["position"]
+            x = (int(position["x"]) + half) // gs * gs
+            y = (int(position["y"]) + half) // gs * gs
+            node = ProfessionalWorkflowNode(node_info["data"], x, y)
+            self.addItem(node)
+            self.nodes.append(node)
+            nodes_by_id[node_info["id"]] = node
+        for conn_info in data.get("connections", []):
+            start_node = nodes_by_id.get(conn_info["start_node"])
+            end_node = nodes_by_id.get(conn_info["end_node"])
+            if start_node is None or end_node is None:
+                continue
+            start_port = start_node.output_ports_by_name.get(
+                conn_info["start_port"])
+            end_port = end_node.input_ports_by_name.get(
+                conn_info["end_port"])
+            if start_port is not None and end_port is not None:
+                connection = Connection(start_port, end_port)
+                self.addItem(connection)
+                self.connections.append(connection)